@@ -38,6 +38,7 @@ Example:
 
 from __future__ import annotations
 
+import sys
 from collections.abc import Callable
 from dataclasses import MISSING
 from dataclasses import dataclass as make_dataclass
@@ -46,6 +47,7 @@ from typing import Any, Protocol, TypeVar, dataclass_transform, overload
 
 from dataclass_dsl._attr_ref import AttrRef
 from dataclass_dsl._metaclass import RefMeta
+from dataclass_dsl._ordering import _clear_caches, _scan_value_dependencies
 from dataclass_dsl._registry import ResourceRegistry
 from dataclass_dsl._utils import apply_metaclass
 
@@ -98,6 +100,7 @@ def create_decorator(
     pre_process: Callable[[type[T]], type[T]] | None = None,
     post_process: Callable[[type[T]], type[T]] | None = None,
     get_resource_type: Callable[[type[T]], type[Any] | str | None] | None = None,
+    slots: bool = False,
 ) -> DecoratorType:
     """
     Create a decorator for declarative dataclass resources.
@@ -118,6 +121,11 @@ def create_decorator(
         post_process: Optional hook called after all transformations.
         get_resource_type: Optional function to extract the resource type
             from a decorated class. Used for registry type-based queries.
+        slots: If True, generate __slots__ for the dataclass fields so
+            instances carry no __dict__. Faster to create and smaller, but
+            instances cannot hold attributes other than their fields, and
+            the decorated class is always a new class object (so it cannot
+            preserve identity for classes RefMeta was already applied to).
 
     Returns:
         A decorator function that can be applied to classes.
@@ -264,7 +272,7 @@ def create_decorator(
             cls.__post_init__ = _refs_post_init  # type: ignore[attr-defined]
 
             # Apply @dataclass decorator
-            cls = make_dataclass(cls)
+            cls = make_dataclass(cls, slots=slots)
 
             # Apply RefMeta metaclass to enable no-parens attribute access
             # Skip if already applied (e.g., by loader's __build_class__ hook)
@@ -275,10 +283,20 @@ def create_decorator(
             # Mark as a decorated class
             setattr(cls, marker_attr, True)
 
+            # Intern the class name: it is emitted as the type name / logical
+            # ID and used as a dict key for every serialized instance.
+            # Classes built dynamically (e.g., by codegen or type()) may
+            # carry non-interned names.
+            cls.__name__ = sys.intern(cls.__name__)
+
             # Run post-process hook
             if post_process is not None:
                 cls = post_process(cls)
 
+            # Record no-parens dependencies once, so graph queries don't
+            # rescan the fields (see get_all_dependencies)
+            cls.__dsl_deps__ = _scan_value_dependencies(cls, marker_attr)  # type: ignore[attr-defined]
+
             # Auto-register if requested and registry is configured
             if register and registry is not None:
                 resource_type: type[Any] | str | None = None
@@ -286,6 +304,10 @@ def create_decorator(
                     resource_type = get_resource_type(cls)
                 registry.register(cls, resource_type)
 
+            # A new class may satisfy forward references, so memoized
+            # dependency results are stale
+            _clear_caches()
+
             return cls
 
         # Support both @refs and @refs() syntax
@@ -26,12 +26,14 @@ from __future__ import annotations
 import importlib.util
 import re
 import sys
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from pathlib import Path
+from threading import RLock
 from types import ModuleType
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from dataclass_dsl._registry import ResourceRegistry
     from dataclass_dsl._stubs import StubConfig
 
 __all__ = [
@@ -335,9 +337,12 @@ def _resolve_class_placeholders(cls: type, class_map: dict[str, type]) -> None:
         cls: The class to resolve placeholders in.
         class_map: Mapping from class name to real class.
     """
+    from dataclass_dsl._ordering import _clear_caches
+
     # Get class annotations for type hints (we don't modify these)
     # We focus on class attributes (field defaults, etc.)
 
+    changed = False
     for attr_name in list(vars(cls)):
         if attr_name.startswith("_"):
             continue
@@ -357,10 +362,15 @@ def _resolve_class_placeholders(cls: type, class_map: dict[str, type]) -> None:
         if resolved is not value:
             try:
                 setattr(cls, attr_name, resolved)
+                changed = True
             except (AttributeError, TypeError):
                 # Some attributes can't be set (e.g., __dict__)
                 pass
 
+    # Resolved references change the dependency graph
+    if changed:
+        _clear_caches()
+
 
 def _resolve_module_placeholders(
     module: ModuleType,
@@ -568,25 +578,23 @@ def _load_module_with_namespace(
     module = importlib.util.module_from_spec(spec)
 
     # Inject shared namespace BEFORE execution
-    # This makes sibling classes available during class body evaluation
-    for name, obj in namespace.items():
-        setattr(module, name, obj)
-
-    # Inject placeholders for local classes not yet in namespace
-    # This enables forward references within the same file
-    if local_class_names:
-        for cls_name in local_class_names:
-            if cls_name not in namespace:
-                placeholder = _ClassPlaceholder(cls_name, full_mod_name)
-                setattr(module, cls_name, placeholder)
-
-    # Inject placeholders for cross-file refs not yet in namespace (cycles)
-    # This enables bare class names like MyRole.Arn even when there's a cycle
-    if cross_file_refs:
-        for cls_name in cross_file_refs:
-            if cls_name not in namespace:
-                placeholder = _ClassPlaceholder(cls_name, full_mod_name)
-                setattr(module, cls_name, placeholder)
+    # This makes sibling classes available during class body evaluation.
+    # A single dict update copies the already-resolved names in one pass,
+    # instead of one setattr per name.
+    module_dict = vars(module)
+    module_dict.update(namespace)
+
+    # Inject placeholders for names not yet in namespace:
+    # - local classes, enabling forward references within the same file
+    # - cross-file refs (cycles), enabling bare class names like MyRole.Arn
+    pending = [*(local_class_names or ()), *(cross_file_refs or ())]
+    module_dict.update(
+        {
+            cls_name: _ClassPlaceholder(cls_name, full_mod_name)
+            for cls_name in pending
+            if cls_name not in namespace
+        }
+    )
 
     # Register in sys.modules before execution (standard Python behavior)
     sys.modules[full_mod_name] = module
@@ -685,7 +693,7 @@ def _auto_decorate_resources(
 
     # Update AttrRef targets in all classes to point to decorated versions
     if class_mapping:
-        _update_attr_refs(package_globals, class_mapping)
+        _update_attr_refs(package_globals, class_mapping, marker_attr=marker_attr)
 
     return class_mapping
 
@@ -693,6 +701,7 @@ def _auto_decorate_resources(
 def _update_attr_refs(
     package_globals: dict[str, Any],
     class_mapping: dict[type, type],
+    marker_attr: str = "_refs_marker",
 ) -> None:
     """Update AttrRef and class reference targets to point to decorated versions.
 
@@ -703,10 +712,12 @@ def _update_attr_refs(
     Args:
         package_globals: The package's globals dict containing classes.
         class_mapping: Mapping from old classes to new decorated classes.
+        marker_attr: The attribute set by the decorator to mark decorated classes.
     """
     from dataclasses import fields
 
     from dataclass_dsl._attr_ref import AttrRef
+    from dataclass_dsl._ordering import _clear_caches, _scan_value_dependencies
 
     for obj in package_globals.values():
         if not isinstance(obj, type):
@@ -729,6 +740,15 @@ def _update_attr_refs(
                 # mypy doesn't track the hasattr check above
                 obj.__dataclass_fields__[fld.name].default = class_mapping[default]  # type: ignore[attr-defined]
 
+        # Rescan the dependencies recorded at decoration time: references to
+        # classes that were not decorated yet (e.g., same-file forward
+        # references) only count now that their targets are decorated
+        if "__dsl_deps__" in obj.__dict__:
+            obj.__dsl_deps__ = _scan_value_dependencies(obj, marker_attr)  # type: ignore[attr-defined]
+
+    # Retargeted references change the dependency graph
+    _clear_caches()
+
 
 def setup_resources(
     init_file: str,
@@ -743,6 +763,8 @@ def setup_resources(
     resource_field: str = "resource",
     marker_attr: str = "_refs_marker",
     resource_predicate: Callable[[type], bool] | None = None,
+    lazy: bool = False,
+    registry: ResourceRegistry | None = None,
 ) -> None:
     """
     Set up resource imports with topological ordering for `from . import *`.
@@ -779,6 +801,13 @@ def setup_resources(
             classes that should be decorated. When provided, takes precedence
             over resource_field annotation checking. Enables inheritance-based
             patterns like `issubclass(cls, BaseResource)`.
+        lazy: If True, scan the package without importing it. Each module is
+            imported (together with the modules it depends on) the first time
+            one of its classes is accessed as a package attribute, e.g. by
+            `from . import *` or `package.Object1`.
+        registry: Optional registry to receive "package:ClassName" placeholders
+            when lazy is True, so that registry queries import the package's
+            classes on demand. The decorator must register to this registry.
 
     Example:
         # In mypackage/objects/__init__.py
@@ -854,72 +883,122 @@ def setup_resources(
     shared_namespace: dict[str, Any] = {}
     if extra_namespace:
         shared_namespace.update(extra_namespace)
-    all_names: list[str] = []
-    loaded_modules: list[ModuleType] = []
-
-    for mod_name in import_order:
-        full_mod_name = f"{package_name}.{mod_name}"
-
-        # Handle pre-loaded modules (can happen with circular imports or
-        # if user imports a file before calling setup_resources)
-        if full_mod_name in sys.modules:
-            module = sys.modules[full_mod_name]
-            # Inject namespace into pre-loaded module so it has access to
-            # service modules and other injected names
-            for name, obj in shared_namespace.items():
-                if not hasattr(module, name):
-                    setattr(module, name, obj)
-        else:
-            # Load module with namespace injection BEFORE execution
-            # Pass local class names for placeholder injection (forward refs)
-            # Pass cross-file refs for placeholder injection (cycles)
-            local_classes = module_classes.get(mod_name, [])
-            cross_file_refs = module_cross_file_refs.get(mod_name, set())
-            module = _load_module_with_namespace(
-                mod_name,
-                full_mod_name,
-                pkg_path,
-                shared_namespace,
-                local_class_names=local_classes,
-                cross_file_refs=cross_file_refs,
-            )
+    loaded_names: list[str] = []
+    loaded_modules: dict[str, ModuleType] = {}
 
-        loaded_modules.append(module)
-
-        # Extract classes from this module and add to shared namespace
-        for cls_name in module_classes.get(mod_name, []):
-            if hasattr(module, cls_name):
-                obj = getattr(module, cls_name)
-                shared_namespace[cls_name] = obj
-                package_globals[cls_name] = obj
-                all_names.append(cls_name)
-
-    # 6. Final resolution pass for cross-file placeholders
-    # Now that all modules are loaded, resolve any remaining placeholders
-    # This handles circular dependencies where some placeholders couldn't
-    # be resolved during initial module loading
-    for module in loaded_modules:
-        for cls_name in dir(module):
-            if cls_name.startswith("_"):
-                continue
-            try:
-                obj = getattr(module, cls_name)
-            except AttributeError:
+    def load_modules(mod_names: Iterable[str]) -> None:
+        for mod_name in mod_names:
+            if mod_name in loaded_modules:
                 continue
-            if isinstance(obj, type):
-                _resolve_class_placeholders(obj, shared_namespace)
-
-    # 7. Auto-decorate resource classes if enabled
-    # This applies the decorator to classes with resource annotations
-    # or matching the resource_predicate, enabling the "invisible decorator" pattern
-    if auto_decorate and decorator is not None:
-        _auto_decorate_resources(
-            package_globals,
-            decorator,
-            resource_field=resource_field,
-            marker_attr=marker_attr,
-            resource_predicate=resource_predicate,
-        )
+            full_mod_name = f"{package_name}.{mod_name}"
+
+            # Handle pre-loaded modules (can happen with circular imports or
+            # if user imports a file before calling setup_resources)
+            if full_mod_name in sys.modules:
+                module = sys.modules[full_mod_name]
+                # Inject namespace into pre-loaded module so it has access to
+                # service modules and other injected names
+                module_dict = vars(module)
+                for name, obj in shared_namespace.items():
+                    module_dict.setdefault(name, obj)
+            else:
+                # Load module with namespace injection BEFORE execution
+                # Pass local class names for placeholder injection (forward refs)
+                # Pass cross-file refs for placeholder injection (cycles)
+                local_classes = module_classes.get(mod_name, [])
+                cross_file_refs = module_cross_file_refs.get(mod_name, set())
+                module = _load_module_with_namespace(
+                    mod_name,
+                    full_mod_name,
+                    pkg_path,
+                    shared_namespace,
+                    local_class_names=local_classes,
+                    cross_file_refs=cross_file_refs,
+                )
+
+            loaded_modules[mod_name] = module
+
+            # Extract classes from this module and add to shared namespace
+            for cls_name in module_classes.get(mod_name, []):
+                if hasattr(module, cls_name):
+                    obj = getattr(module, cls_name)
+                    shared_namespace[cls_name] = obj
+                    package_globals[cls_name] = obj
+                    loaded_names.append(cls_name)
+
+        # 6. Final resolution pass for cross-file placeholders
+        # Now that all modules are loaded, resolve any remaining placeholders
+        # This handles circular dependencies where some placeholders couldn't
+        # be resolved during initial module loading
+        for module in loaded_modules.values():
+            for cls_name in dir(module):
+                if cls_name.startswith("_"):
+                    continue
+                try:
+                    obj = getattr(module, cls_name)
+                except AttributeError:
+                    continue
+                if isinstance(obj, type):
+                    _resolve_class_placeholders(obj, shared_namespace)
+
+        # 7. Auto-decorate resource classes if enabled
+        # This applies the decorator to classes with resource annotations
+        # or matching the resource_predicate, enabling the "invisible decorator"
+        # pattern
+        if auto_decorate and decorator is not None:
+            class_mapping = _auto_decorate_resources(
+                package_globals,
+                decorator,
+                resource_field=resource_field,
+                marker_attr=marker_attr,
+                resource_predicate=resource_predicate,
+            )
+            # Modules loaded later must see the decorated classes
+            for name, obj in shared_namespace.items():
+                if isinstance(obj, type) and obj in class_mapping:
+                    shared_namespace[name] = class_mapping[obj]
+
+    if lazy:
+        # Defer imports: each class name loads its module (and the modules it
+        # depends on) on first attribute access via PEP 562 __getattr__
+        position = {mod: i for i, mod in enumerate(import_order)}
+        load_lock = RLock()
+
+        def required_modules(mod_name: str) -> list[str]:
+            required: set[str] = set()
+            stack = [mod_name]
+            while stack:
+                mod = stack.pop()
+                if mod in required or mod in loaded_modules:
+                    continue
+                required.add(mod)
+                stack.extend(deps.get(mod, ()))
+            return sorted(required, key=position.__getitem__)
+
+        def __getattr__(name: str) -> Any:
+            mod_name = class_to_module.get(name)
+            if mod_name is not None:
+                with load_lock:
+                    # Like the eager path, `from . import *` inside the loaded
+                    # modules must only see names that already exist
+                    exported = package_globals.pop("__all__", None)
+                    try:
+                        load_modules(required_modules(mod_name))
+                    finally:
+                        if exported is not None:
+                            package_globals["__all__"] = exported
+                if name in package_globals:
+                    return package_globals[name]
+            raise AttributeError(f"module {package_name!r} has no attribute {name!r}")
+
+        package_globals["__getattr__"] = __getattr__
+        all_names = [name for mod in import_order for name in module_classes[mod]]
+        if registry is not None:
+            for name in all_names:
+                registry.register_lazy(name, f"{package_name}:{name}")
+    else:
+        load_modules(import_order)
+        all_names = loaded_names
 
     # 8. Set __all__ for star imports
     package_globals["__all__"] = all_names
@@ -11,8 +11,11 @@ the no-parens pattern.
 
 from __future__ import annotations
 
+import weakref
+from collections import defaultdict, deque
 from dataclasses import MISSING, fields
 from typing import Any
+from weakref import WeakKeyDictionary
 
 from dataclass_dsl._importer.topology import find_sccs_in_graph
 from dataclass_dsl._types import get_dependencies as _get_annotated_dependencies
@@ -27,6 +30,17 @@ __all__ = [
     "get_dependency_graph",
 ]
 
+# Bumped by _clear_caches() so holders of derived orderings (e.g., the
+# registry) can tell when the dependency graph may have changed
+_cache_generation = 0
+
+# Memoized get_all_dependencies() results: class -> {marker: weak references
+# to its dependencies}. Weak on both sides, so the cache never keeps a class
+# alive
+_dependency_cache: WeakKeyDictionary[
+    type[Any], dict[str, tuple[weakref.ref[type[Any]], ...]]
+] = WeakKeyDictionary()
+
 
 def get_all_dependencies(
     cls: type[Any],
@@ -40,6 +54,10 @@ def get_all_dependencies(
     2. Runtime AttrRef dependencies from no-parens pattern (Object1.Id)
     3. Runtime class reference dependencies (e.g., parent = Object1)
 
+    Results are memoized per class until a class is decorated or the loader
+    rewrites references. Changes made to a class's annotations or field
+    defaults in between are not seen until then.
+
     Args:
         cls: The wrapper class to analyze.
         marker: The marker attribute name for detecting decorated classes.
@@ -52,6 +70,24 @@ def get_all_dependencies(
         >>> Object2 in deps
         True
     """
+    cached = _dependency_cache.get(cls)
+    if cached is not None and marker in cached:
+        return {dep for ref in cached[marker] if (dep := ref()) is not None}
+
+    deps = _compute_all_dependencies(cls, marker)
+    try:
+        refs = tuple(weakref.ref(dep) for dep in deps)
+    except TypeError:
+        return deps  # A dependency can't be weakly referenced; don't memoize
+    _dependency_cache.setdefault(cls, {})[marker] = refs
+    return deps
+
+
+def _compute_all_dependencies(
+    cls: type[Any],
+    marker: str,
+) -> set[type[Any]]:
+    """Compute get_all_dependencies() without the memo."""
     deps: set[type[Any]] = set()
 
     # Get dependencies from Annotated type hints
@@ -60,7 +96,34 @@ def get_all_dependencies(
     except Exception:
         pass  # Ignore errors from type introspection
 
-    # Get runtime dependencies from dataclass fields
+    # Get runtime dependencies from dataclass fields, precomputed at
+    # decoration time when available
+    value_deps = cls.__dict__.get("__dsl_deps__")
+    if value_deps is None or marker not in cls.__dict__:
+        value_deps = _scan_value_dependencies(cls, marker)
+    deps.update(value_deps)
+
+    return deps
+
+
+def _scan_value_dependencies(
+    cls: type[Any],
+    marker: str = DEFAULT_MARKER,
+) -> frozenset[type[Any]]:
+    """
+    Collect no-parens references from a class's dataclass field defaults.
+
+    Finds AttrRef targets (Object1.Id) and decorated class references
+    (Object1). The decorator stores the result as ``cls.__dsl_deps__``.
+
+    Args:
+        cls: The wrapper class to scan.
+        marker: The marker attribute name for detecting decorated classes.
+
+    Returns:
+        Frozenset of referenced classes (empty if cls is not a dataclass).
+    """
+    deps: set[type[Any]] = set()
     try:
         for field in fields(cls):
             default = field.default
@@ -73,13 +136,10 @@ def get_all_dependencies(
             # Check for class reference (no-parens pattern like Object1)
             elif is_class_ref(default, marker):
                 deps.add(default)
-            elif isinstance(default, type) and hasattr(default, marker):
-                deps.add(default)
     except TypeError:
         # Not a dataclass, skip
         pass
-
-    return deps
+    return frozenset(deps)
 
 
 def topological_sort(
@@ -91,7 +151,8 @@ def topological_sort(
 
     Uses get_all_dependencies() to compute the dependency graph,
     then performs a topological sort so that dependencies appear before
-    dependents.
+    dependents. Dependencies on classes not in the list are ignored.
+    Independent classes keep their relative input order.
 
     Args:
         classes: List of wrapper classes to sort.
@@ -112,39 +173,28 @@ def topological_sort(
     if not classes:
         return []
 
-    class_set = set(classes)
+    # Kahn's algorithm: O(V + E), ties broken by input order
+    graph = get_dependency_graph(classes, marker)
+    in_degree = {cls: len(deps) for cls, deps in graph.items()}
+    dependents: dict[type[Any], list[type[Any]]] = defaultdict(list)
+    for cls, deps in graph.items():
+        for dep in deps:
+            dependents[dep].append(cls)
+
+    ready = deque(cls for cls, degree in in_degree.items() if degree == 0)
     sorted_result: list[type[Any]] = []
-    remaining = set(classes)
-
-    # Track iterations to detect cycles
-    max_iterations = len(classes) * len(classes)
-    iterations = 0
-
-    while remaining:
-        iterations += 1
-        if iterations > max_iterations:
-            # Find classes involved in cycle
-            cycle_classes = [c.__name__ for c in remaining]
-            raise ValueError(f"Circular dependency detected involving: {cycle_classes}")
-
-        # Find classes whose dependencies are all satisfied
-        ready = [
-            cls
-            for cls in remaining
-            if get_all_dependencies(cls, marker).issubset(
-                set(sorted_result) | (set(classes) - class_set)
-            )
-        ]
-
-        if not ready:
-            # All remaining classes have unsatisfied dependencies
-            # This indicates a circular dependency
-            cycle_classes = [c.__name__ for c in remaining]
-            raise ValueError(f"Circular dependency detected involving: {cycle_classes}")
-
-        for cls in ready:
-            sorted_result.append(cls)
-            remaining.remove(cls)
+    while ready:
+        cls = ready.popleft()
+        sorted_result.append(cls)
+        for dependent in dependents[cls]:
+            in_degree[dependent] -= 1
+            if in_degree[dependent] == 0:
+                ready.append(dependent)
+
+    if len(sorted_result) < len(in_degree):
+        # Classes still waiting on dependencies are part of (or behind) a cycle
+        cycle_classes = [c.__name__ for c, degree in in_degree.items() if degree]
+        raise ValueError(f"Circular dependency detected involving: {cycle_classes}")
 
     return sorted_result
 
@@ -192,7 +242,20 @@ def get_deletion_order(
         >>> order = get_deletion_order([Object3, Object2, Object1])
         >>> # Object3 deleted first, then Object2, then Object1
     """
-    return list(reversed(topological_sort(classes, marker)))
+    return topological_sort(classes, marker)[::-1]
+
+
+def _clear_caches() -> None:
+    """
+    Invalidate memoized dependency results.
+
+    Called whenever a class is registered or its references are rewritten
+    (e.g., placeholder resolution in the loader), since either can change
+    the dependency graph.
+    """
+    global _cache_generation
+    _dependency_cache.clear()
+    _cache_generation += 1
 
 
 def detect_cycles(
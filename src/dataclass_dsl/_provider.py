@@ -20,14 +20,32 @@ Example:
 
 from __future__ import annotations
 
+import sys
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any
+from collections.abc import Iterator
+from dataclasses import fields, is_dataclass
+from typing import TYPE_CHECKING, Any, ClassVar
+from weakref import WeakKeyDictionary
+
+from dataclass_dsl._attr_ref import AttrRef
 
 if TYPE_CHECKING:
     from dataclass_dsl._template import Template
 
 __all__ = ["Provider"]
 
+# Sentinel for fields absent from an instance
+_MISSING = object()
+
+# Top-level template section keys
+_DESCRIPTION_KEY = sys.intern("Description")
+_RESOURCES_KEY = sys.intern("Resources")
+_PARAMETERS_KEY = sys.intern("Parameters")
+_OUTPUTS_KEY = sys.intern("Outputs")
+_CONDITIONS_KEY = sys.intern("Conditions")
+_MAPPINGS_KEY = sys.intern("Mappings")
+_METADATA_KEY = sys.intern("Metadata")
+
 
 class Provider(ABC):
     """
@@ -53,8 +71,16 @@ class Provider(ABC):
         ...         return {"name": type(resource).__name__}
     """
 
+    __slots__ = ()
+
     name: str  # Provider identifier
 
+    # Per-class cache of (type name, public dataclass field names), shared by
+    # all providers; weak keys so dynamically created classes can be collected
+    _field_cache: ClassVar[
+        WeakKeyDictionary[type[Any], tuple[str, tuple[str, ...]]]
+    ] = WeakKeyDictionary()
+
     @abstractmethod
     def serialize_ref(
         self,
@@ -122,7 +148,7 @@ class Provider(ABC):
         """
         Serialize a complete template.
 
-        Default implementation builds a dict with serialized resources.
+        Default implementation builds a dict from iter_template().
         Override for domain-specific template structure.
 
         Args:
@@ -131,28 +157,150 @@ class Provider(ABC):
         Returns:
             Provider-specific template representation.
         """
-        resources: dict[str, Any] = {}
-        for resource in template.get_dependency_order():
-            logical_id = self.get_logical_id(type(resource))
-            resources[logical_id] = self.serialize_resource(resource)
-
         result: dict[str, Any] = {}
+        for key, value in self.iter_template(template):
+            result[key] = dict(value) if key == _RESOURCES_KEY else value
+        return result
+
+    def iter_template(
+        self,
+        template: Template,
+    ) -> Iterator[tuple[str, Any]]:
+        """
+        Yield the top-level sections of a template in output order.
+
+        Empty sections are skipped. The "Resources" value is the lazy
+        iter_resources() iterator, so callers can stream resources one
+        at a time instead of materializing them all.
+
+        Args:
+            template: The Template to serialize.
+
+        Yields:
+            (section name, section value) pairs.
+        """
         if template.description:
-            result["Description"] = template.description
-        if resources:
-            result["Resources"] = resources
+            yield _DESCRIPTION_KEY, template.description
+        if template.resources:
+            yield _RESOURCES_KEY, self.iter_resources(template)
         if template.parameters:
-            result["Parameters"] = template.parameters
+            yield _PARAMETERS_KEY, template.parameters
         if template.outputs:
-            result["Outputs"] = template.outputs
+            yield _OUTPUTS_KEY, template.outputs
         if template.conditions:
-            result["Conditions"] = template.conditions
+            yield _CONDITIONS_KEY, template.conditions
         if template.mappings:
-            result["Mappings"] = template.mappings
+            yield _MAPPINGS_KEY, template.mappings
         if template.metadata:
-            result["Metadata"] = template.metadata
+            yield _METADATA_KEY, template.metadata
 
-        return result
+    def iter_resources(
+        self,
+        template: Template,
+    ) -> Iterator[tuple[str, dict[str, Any]]]:
+        """
+        Serialize a template's resources one at a time, in dependency order.
+
+        Resources sharing a logical ID collapse the way a dict would: the ID
+        keeps its first position and the last resource wins.
+
+        Args:
+            template: The Template whose resources to serialize.
+
+        Yields:
+            (logical ID, serialized resource) pairs, with unique logical IDs.
+        """
+        by_id: dict[str, Any] = {}
+        for resource in template.get_dependency_order():
+            by_id[self.get_logical_id(type(resource))] = resource
+        for logical_id, resource in by_id.items():
+            yield logical_id, self.serialize_resource(resource)
+
+    def _get_field_info(self, resource: Any) -> tuple[str, tuple[str, ...]]:
+        """Return the (type name, public field names) entry for a resource."""
+        cls = type(resource)
+        info = self._field_cache.get(cls)
+        if info is None:
+            if not is_dataclass(cls):
+                # Without declared fields, candidates come from the instance
+                names = tuple(n for n in vars(resource) if not n.startswith("_"))
+                return cls.__name__, names
+            names = tuple(
+                sys.intern(f.name) for f in fields(cls) if not f.name.startswith("_")
+            )
+            info = (sys.intern(cls.__name__), names)
+            self._field_cache[cls] = info
+        return info
+
+    def get_type_name(self, resource: Any) -> str:
+        """
+        Get the interned class name of a resource.
+
+        Cached alongside the field names (see get_property_names()).
+
+        Args:
+            resource: The wrapper resource instance.
+
+        Returns:
+            The resource's class name.
+        """
+        return self._get_field_info(resource)[0]
+
+    def get_property_names(self, resource: Any) -> tuple[str, ...]:
+        """
+        Get the names of a resource's plain data fields.
+
+        Private attributes, class references and AttrRefs are excluded;
+        those are serialized via serialize_ref() and serialize_attr().
+        A dataclass's public field names are cached per class; values are
+        checked on every call, since the same field may hold a reference on
+        one instance and plain data on another.
+
+        Args:
+            resource: The wrapper resource instance.
+
+        Returns:
+            Tuple of interned field names.
+        """
+        candidates = self._get_field_info(resource)[1]
+        names = tuple(
+            n
+            for n in candidates
+            if (v := getattr(resource, n, _MISSING)) is not _MISSING
+            and not isinstance(v, (type, AttrRef))
+        )
+        # Reuse the cached tuple when nothing was excluded
+        return candidates if len(names) == len(candidates) else names
+
+    def get_properties(self, resource: Any) -> dict[str, Any]:
+        """
+        Get a resource's plain data fields as a dict.
+
+        Args:
+            resource: The wrapper resource instance.
+
+        Returns:
+            Dict mapping field name to value (see get_property_names()).
+            Fields missing from this instance are omitted.
+
+        Example:
+            >>> def serialize_resource(self, resource):
+            ...     return {
+            ...         "type": self.get_type_name(resource),
+            ...         "properties": self.get_properties(resource),
+            ...     }
+        """
+        candidates = self._get_field_info(resource)[1]
+        d = getattr(resource, "__dict__", None)
+        if d is None:
+            values = ((n, getattr(resource, n, _MISSING)) for n in candidates)
+        else:
+            values = ((n, d.get(n, _MISSING)) for n in candidates)
+        return {
+            n: v
+            for n, v in values
+            if v is not _MISSING and not isinstance(v, (type, AttrRef))
+        }
 
     def get_logical_id(self, wrapper_cls: type[Any]) -> str:
         """
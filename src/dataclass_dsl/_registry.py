@@ -24,13 +24,25 @@ Example:
 
 from __future__ import annotations
 
-from collections.abc import Iterator
+import importlib
+from collections.abc import Iterable, Iterator
 from threading import Lock
 from typing import Any
 
 __all__ = ["ResourceRegistry"]
 
 
+def _materialize_placeholder(path: str) -> Any:
+    """
+    Resolve a "package.module:ClassName" placeholder to the object it names.
+
+    Not cached: importing is what registers the class, and importlib already
+    caches modules. A re-imported package must register again.
+    """
+    module_name, _, attr = path.partition(":")
+    return getattr(importlib.import_module(module_name), attr)
+
+
 class ResourceRegistry:
     """
     Thread-safe registry for decorated classes.
@@ -46,7 +58,12 @@ class ResourceRegistry:
 
     Attributes:
         _resources: Dict mapping class name to class.
+        _classes: Set of registered classes, for O(1) membership checks.
+        _pending: Dict mapping class name to a "module:ClassName" placeholder
+            for classes registered lazily and not imported yet.
         _by_type: Dict mapping resource type to list of classes.
+        _orders: Cached (creation, deletion) orders, keyed by scope package.
+        _orders_generation: Dependency cache generation the orders belong to.
         _lock: Threading lock for thread-safe operations.
 
     Example:
@@ -64,9 +81,15 @@ class ResourceRegistry:
     def __init__(self) -> None:
         """Initialize an empty registry."""
         self._resources: dict[str, type[Any]] = {}  # class_name -> class
+        self._classes: set[type[Any]] = set()
+        self._pending: dict[str, str] = {}  # class_name -> "module:ClassName"
         self._by_type: dict[
             type[Any] | str, list[type[Any]]
         ] = {}  # resource_type -> [classes]
+        self._orders: dict[
+            str | None, tuple[tuple[type[Any], ...], tuple[type[Any], ...]]
+        ] = {}  # scope_package -> (creation order, deletion order)
+        self._orders_generation = -1
         self._lock = Lock()
 
     def register(
@@ -90,13 +113,60 @@ class ResourceRegistry:
         """
         with self._lock:
             name = wrapper_cls.__name__
-            self._resources[name] = wrapper_cls
+            previous = self._resources.get(name)
+            if previous is not wrapper_cls:
+                if previous is not None:
+                    # Same name re-registered with a new class replaces it
+                    self._classes.discard(previous)
+                self._resources[name] = wrapper_cls
+                self._classes.add(wrapper_cls)
+                self._orders.clear()
+            self._pending.pop(name, None)
 
             if resource_type is not None:
                 if resource_type not in self._by_type:
                     self._by_type[resource_type] = []
                 self._by_type[resource_type].append(wrapper_cls)
 
+    def register_lazy(self, name: str, path: str) -> None:
+        """
+        Register a placeholder for a class that has not been imported yet.
+
+        The placeholder is materialized on first access through get_all(),
+        get_by_name(), `in`, len(), iteration or the order methods. Importing
+        it is expected to register the real class (e.g. via a registering
+        decorator), which replaces the placeholder. A placeholder whose import
+        registers nothing is dropped.
+
+        Args:
+            name: The class name (e.g., "Object1").
+            path: Entry-point style "module:ClassName" path to import.
+
+        Example:
+            >>> registry.register_lazy("Object1", "myproject.objects:Object1")
+            >>> "Object1" in registry
+            True
+        """
+        with self._lock:
+            if name not in self._resources:
+                self._pending[name] = path
+
+    def _materialize(self, names: Iterable[str] | None = None) -> None:
+        """Import pending placeholders (all of them when names is None)."""
+        with self._lock:
+            if not self._pending:
+                return
+            if names is None:
+                pending = list(self._pending.items())
+            else:
+                pending = [(n, self._pending[n]) for n in names if n in self._pending]
+
+        # Import outside the lock: the import registers classes on this registry
+        for name, path in pending:
+            _materialize_placeholder(path)
+            with self._lock:
+                self._pending.pop(name, None)
+
     def get_all(self, scope_package: str | None = None) -> list[type[Any]]:
         """
         Get all registered wrapper classes, optionally filtered by package.
@@ -114,6 +184,7 @@ class ResourceRegistry:
             >>> registry.get_all("myproject.objects")  # Only from myproject.objects.*
             [<class 'Object1'>]
         """
+        self._materialize()
         with self._lock:
             resources = list(self._resources.values())
 
@@ -121,6 +192,74 @@ class ResourceRegistry:
             resources = [r for r in resources if r.__module__.startswith(scope_package)]
         return resources
 
+    def get_creation_order(
+        self,
+        scope_package: str | None = None,
+    ) -> list[type[Any]]:
+        """
+        Get registered wrapper classes in creation order (dependencies first).
+
+        The order is computed once per scope and reused until a class is
+        registered or the dependency graph changes.
+
+        Args:
+            scope_package: If provided, only return resources from modules
+                that start with this package name.
+
+        Returns:
+            List of registered wrapper classes, dependencies first.
+
+        Raises:
+            ValueError: If circular dependencies exist.
+
+        Example:
+            >>> registry.get_creation_order()
+            [<class 'Object1'>, <class 'Object2'>, <class 'Object3'>]
+        """
+        return list(self._get_orders(scope_package)[0])
+
+    def get_deletion_order(
+        self,
+        scope_package: str | None = None,
+    ) -> list[type[Any]]:
+        """
+        Get registered wrapper classes in deletion order (dependents first).
+        Cached together with the creation order.
+
+        Args:
+            scope_package: If provided, only return resources from modules
+                that start with this package name.
+
+        Returns:
+            List of registered wrapper classes, reverse of creation order.
+
+        Raises:
+            ValueError: If circular dependencies exist.
+        """
+        return list(self._get_orders(scope_package)[1])
+
+    def _get_orders(
+        self,
+        scope_package: str | None,
+    ) -> tuple[tuple[type[Any], ...], tuple[type[Any], ...]]:
+        """Return cached (creation, deletion) orders, sorting on a miss."""
+        from dataclass_dsl import _ordering
+
+        self._materialize()
+        with self._lock:
+            if self._orders_generation != _ordering._cache_generation:
+                self._orders.clear()
+                self._orders_generation = _ordering._cache_generation
+            orders = self._orders.get(scope_package)
+        if orders is not None:
+            return orders
+
+        creation = tuple(_ordering.topological_sort(self.get_all(scope_package)))
+        orders = (creation, creation[::-1])
+        with self._lock:
+            self._orders[scope_package] = orders
+        return orders
+
     def get_by_type(self, resource_type: type[Any] | str) -> list[type[Any]]:
         """
         Get wrapper classes by their underlying resource type.
@@ -136,6 +275,7 @@ class ResourceRegistry:
             >>> len(objects)
             1
         """
+        self._materialize()
         with self._lock:
             return list(self._by_type.get(resource_type, []))
 
@@ -155,6 +295,7 @@ class ResourceRegistry:
             >>> registry.get_by_name("NonExistent")
             None
         """
+        self._materialize((name,))
         with self._lock:
             return self._resources.get(name)
 
@@ -171,24 +312,31 @@ class ResourceRegistry:
         """
         with self._lock:
             self._resources.clear()
+            self._classes.clear()
+            self._pending.clear()
             self._by_type.clear()
+            self._orders.clear()
 
     def __len__(self) -> int:
         """Return the number of registered resources."""
+        self._materialize()
         with self._lock:
             return len(self._resources)
 
     def __contains__(self, item: str | type) -> bool:
         """Check if a resource is registered by name or class."""
+        if isinstance(item, str):
+            self._materialize((item,))
         with self._lock:
             if isinstance(item, str):
                 return item in self._resources
             elif isinstance(item, type):
-                return item in self._resources.values()
+                return item in self._classes
             return False
 
     def __iter__(self) -> Iterator[type[Any]]:
         """Iterate over registered classes."""
+        self._materialize()
         with self._lock:
             return iter(list(self._resources.values()))
 
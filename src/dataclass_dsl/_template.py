@@ -8,16 +8,14 @@ to various output formats via providers.
 from __future__ import annotations
 
 import json
-from collections.abc import Callable
-from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field, fields, is_dataclass
+from typing import Any
 
 from dataclass_dsl._ordering import get_creation_order
+from dataclass_dsl._provider import _RESOURCES_KEY, Provider
 from dataclass_dsl._registry import ResourceRegistry
 
-if TYPE_CHECKING:
-    from dataclass_dsl._provider import Provider
-
 __all__ = ["Template", "RefTransformer"]
 
 # Type alias for ref transformer callback
@@ -25,6 +23,125 @@ __all__ = ["Template", "RefTransformer"]
 RefTransformer = Callable[[str, Any, Any], Any]
 
 
+def _default_encoder(obj: Any) -> Any:
+    """Encode objects the JSON encoder does not handle natively."""
+    if hasattr(obj, "to_dict"):
+        return obj.to_dict()
+    if hasattr(obj, "__dict__"):
+        return obj.__dict__
+    if is_dataclass(obj):
+        # Slotted dataclass instances have no __dict__
+        return {f.name: getattr(obj, f.name) for f in fields(obj)}
+    return str(obj)
+
+
+def _dumps(data: Any, indent: int | None) -> str:
+    """Encode data as JSON with the stdlib encoder."""
+    return json.dumps(data, indent=indent, default=_default_encoder)
+
+
+def _dumps_orjson(data: Any, indent: int | None) -> str:
+    """
+    Encode data as JSON with orjson.
+
+    orjson only supports 2-space indentation, so other indent levels use
+    the stdlib encoder. Values orjson rejects (e.g., non-string keys or
+    integers wider than 64 bits) also fall back to the stdlib encoder.
+
+    Raises:
+        ImportError: If orjson is not installed.
+    """
+    try:
+        import orjson
+    except ImportError as e:
+        raise ImportError(
+            "orjson is required for use_orjson=True. Install with: pip install orjson"
+        ) from e
+
+    if indent == 2:
+        try:
+            return orjson.dumps(
+                data,
+                default=_default_encoder,
+                option=orjson.OPT_INDENT_2
+                | orjson.OPT_PASSTHROUGH_DATACLASS
+                | orjson.OPT_PASSTHROUGH_DATETIME,
+            ).decode()
+        except TypeError:
+            pass
+    return _dumps(data, indent)
+
+
+def _pad(indent: int | None, level: int) -> str:
+    """Return the line break and indentation json.dumps uses at a level."""
+    if indent is None:
+        return ""
+    return "\n" + " " * (indent * level)
+
+
+def _dumps_nested(data: Any, indent: int | None, level: int) -> str:
+    """Encode data as JSON indented for the given nesting level."""
+    text = _dumps(data, indent)
+    if indent:
+        # Raw newlines only come from indentation (strings escape them)
+        text = text.replace("\n", _pad(indent, level))
+    return text
+
+
+def _iter_json_layout(
+    sections: Iterable[tuple[str, str | Iterable[tuple[str, str]]]],
+    indent: int | None,
+) -> Iterator[str]:
+    """
+    Lay out pre-encoded template sections the way json.dumps would.
+
+    Each section is an (encoded key, encoded value) pair. A non-str value
+    is an iterable of (encoded key, encoded value) pairs, rendered as a
+    nested object one level down (the Resources section).
+    """
+    item_sep = "," if indent is not None else ", "
+    started = False
+    for key, value in sections:
+        prefix = item_sep if started else "{"
+        started = True
+        yield f"{prefix}{_pad(indent, 1)}{key}: "
+
+        if isinstance(value, str):
+            yield value
+            continue
+
+        opened = False
+        for sub_key, sub_value in value:
+            prefix = item_sep if opened else "{"
+            opened = True
+            yield f"{prefix}{_pad(indent, 2)}{sub_key}: {sub_value}"
+        yield f"{_pad(indent, 1)}}}" if opened else "{}"
+
+    yield f"{_pad(indent, 0)}}}" if started else "{}"
+
+
+def _uses_default_structure(template: Template, provider: Provider) -> bool:
+    """Check whether a template's dict form is laid out via iter_template()."""
+    return (
+        type(template).to_dict is Template.to_dict
+        and type(provider).serialize_template is Provider.serialize_template
+    )
+
+
+def _yields_unique_resources(provider: Provider) -> bool:
+    """Check whether a provider's Resources section has unique logical IDs."""
+    provider_type = type(provider)
+    return (
+        provider_type.iter_template is Provider.iter_template
+        and provider_type.iter_resources is Provider.iter_resources
+    )
+
+
+def _resource_items(value: Any) -> Iterable[tuple[str, Any]]:
+    """Return the (logical ID, body) pairs of a Resources section value."""
+    return value.items() if isinstance(value, dict) else value
+
+
 @dataclass
 class Template:
     """
@@ -62,6 +179,15 @@ class Template:
     mappings: dict[str, Any] = field(default_factory=dict)
     metadata: dict[str, Any] | None = None
 
+    # (resource ids, ordered resources) from the last get_dependency_order()
+    _order_cache: tuple[tuple[int, ...], list[Any]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # (shape, skeleton) from the last compile()
+    _skeleton_cache: tuple[tuple[Any, ...], str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     @classmethod
     def from_registry(
         cls,
@@ -112,12 +238,8 @@ class Template:
             ...     ref_transformer=transform_refs,
             ... )
         """
-        from dataclass_dsl._ordering import topological_sort
-
-        wrapper_classes = list(registry.get_all(scope_package=scope_package))
-
-        # Topologically sort by dependencies (dependencies first)
-        sorted_classes = topological_sort(wrapper_classes)
+        # Registry keeps classes sorted by dependencies (dependencies first)
+        sorted_classes = registry.get_creation_order(scope_package=scope_package)
 
         # Instantiate all wrapper classes
         resources = []
@@ -127,7 +249,11 @@ class Template:
 
                 # Apply ref transformer if provided
                 if ref_transformer is not None:
-                    for field_name in list(instance.__dict__.keys()):
+                    if hasattr(instance, "__dict__"):
+                        field_names = list(instance.__dict__.keys())
+                    else:
+                        field_names = [f.name for f in fields(instance)]
+                    for field_name in field_names:
                         if field_name.startswith("_"):
                             continue
                         value = getattr(instance, field_name)
@@ -145,11 +271,15 @@ class Template:
                     stacklevel=2,
                 )
 
-        return cls(
+        template = cls(
             description=description,
             resources=resources,
             **kwargs,
         )
+        # Instances already follow the registry's creation order, so seed the
+        # dependency order cache instead of sorting them again
+        template._order_cache = (tuple(map(id, resources)), list(resources))
+        return template
 
     def add_resource(self, resource: Any) -> None:
         """
@@ -164,7 +294,8 @@ class Template:
         """
         Return resources in dependency order.
 
-        Dependencies appear before dependents.
+        Dependencies appear before dependents. The result is cached until
+        the resource list changes.
 
         Returns:
             List of resources sorted by dependencies.
@@ -172,6 +303,10 @@ class Template:
         if not self.resources:
             return []
 
+        key = tuple(map(id, self.resources))
+        if self._order_cache is not None and self._order_cache[0] == key:
+            return list(self._order_cache[1])
+
         # Get the classes and their order
         classes = [type(r) for r in self.resources]
         ordered_classes = get_creation_order(classes)
@@ -179,11 +314,13 @@ class Template:
         # Map instances to their class for reordering
         class_to_instance = {type(r): r for r in self.resources}
 
-        return [
+        ordered = [
             class_to_instance[cls]
             for cls in ordered_classes
             if cls in class_to_instance
         ]
+        self._order_cache = (key, ordered)
+        return list(ordered)
 
     def to_dict(self, provider: Provider | None = None) -> dict[str, Any]:
         """
@@ -225,28 +362,168 @@ class Template:
         self,
         provider: Provider | None = None,
         indent: int = 2,
+        *,
+        use_orjson: bool = False,
     ) -> str:
         """
         Serialize template to JSON string.
 
+        Output is encoded with the stdlib json module unless use_orjson is
+        set. orjson is faster but its text differs from the stdlib's: for
+        example NaN becomes null, non-ASCII characters are not escaped, and
+        enum members are encoded by value.
+
+        With the default template structure (neither the provider's
+        serialize_template() nor this class's to_dict() overridden), only the
+        section values and resource bodies are encoded per call; they are
+        substituted into the cached skeleton from compile().
+
         Args:
             provider: Provider for format-specific serialization.
             indent: JSON indentation level.
+            use_orjson: Encode the whole document with orjson (indent 2 only;
+                other indent levels use the stdlib encoder).
 
         Returns:
             JSON string representation.
+
+        Raises:
+            ImportError: If use_orjson is True and orjson is not installed.
         """
-        data = self.to_dict(provider=provider)
+        if use_orjson:
+            return _dumps_orjson(self.to_dict(provider=provider), indent)
+        if provider is None or not _uses_default_structure(self, provider):
+            return _dumps(self.to_dict(provider=provider), indent)
+
+        section_keys: list[str] = []
+        logical_ids: tuple[str, ...] = ()
+        values: list[str] = []
+        for key, value in provider.iter_template(self):
+            section_keys.append(key)
+            if key != _RESOURCES_KEY:
+                values.append(_dumps_nested(value, indent, 1))
+                continue
+            # Collapse duplicate logical IDs like to_dict() does
+            bodies = {
+                logical_id: _dumps_nested(body, indent, 2)
+                for logical_id, body in _resource_items(value)
+            }
+            logical_ids = tuple(bodies)
+            values.extend(bodies.values())
+
+        skeleton = self._get_skeleton(
+            type(provider), indent, tuple(section_keys), logical_ids
+        )
+        return skeleton % tuple(values)
+
+    def compile(self, provider: Provider, indent: int = 2) -> str:
+        """
+        Build the JSON skeleton for the template's current shape.
+
+        Keys, brackets and separators are rendered once; every section value
+        and resource body is a ``%s`` placeholder, filled in by to_json().
+        The skeleton is cached and rebuilt only when the shape changes
+        (provider class, indent, present sections or resource logical IDs).
+
+        The shape is taken from what the provider's iter_template() and
+        iter_resources() actually yield, so providers that filter or rename
+        resources get a matching skeleton.
+
+        Args:
+            provider: Provider using the default template structure.
+            indent: JSON indentation level.
+
+        Returns:
+            The skeleton as a %-format string.
+        """
+        section_keys: list[str] = []
+        logical_ids: list[str] = []
+        for key, value in provider.iter_template(self):
+            section_keys.append(key)
+            if key == _RESOURCES_KEY:
+                logical_ids.extend(dict(_resource_items(value)))
+
+        return self._get_skeleton(
+            type(provider), indent, tuple(section_keys), tuple(logical_ids)
+        )
+
+    def _get_skeleton(
+        self,
+        provider_type: type[Provider],
+        indent: int,
+        section_keys: tuple[str, ...],
+        logical_ids: tuple[str, ...],
+    ) -> str:
+        """Return the cached skeleton for a shape, rendering it on a miss."""
+        shape = (provider_type, indent, section_keys, logical_ids)
+        if self._skeleton_cache is not None and self._skeleton_cache[0] == shape:
+            return self._skeleton_cache[1]
+
+        def encode_key(key: str) -> str:
+            return _dumps(key, indent).replace("%", "%%")
+
+        sections = [
+            (
+                encode_key(key),
+                [(encode_key(lid), "%s") for lid in logical_ids]
+                if key == _RESOURCES_KEY
+                else "%s",
+            )
+            for key in section_keys
+        ]
+        skeleton = "".join(_iter_json_layout(sections, indent))
+        self._skeleton_cache = (shape, skeleton)
+        return skeleton
+
+    def iter_json_chunks(
+        self,
+        provider: Provider | None = None,
+        indent: int = 2,
+    ) -> Iterator[str]:
+        """
+        Serialize template to JSON, yielding the output in chunks.
+
+        Resources are serialized one at a time, so peak memory is bounded
+        by the largest resource rather than the whole template. The joined
+        chunks are identical to to_json() output.
+
+        Streaming requires the default template structure. If the provider
+        overrides serialize_template(), the template class overrides
+        to_dict(), or no provider is given, the whole document is yielded
+        as a single chunk.
 
-        # Custom encoder to handle non-serializable objects
-        def default_encoder(obj: Any) -> Any:
-            if hasattr(obj, "to_dict"):
-                return obj.to_dict()
-            if hasattr(obj, "__dict__"):
-                return obj.__dict__
-            return str(obj)
+        Args:
+            provider: Provider for format-specific serialization.
+            indent: JSON indentation level.
+
+        Yields:
+            Consecutive pieces of the JSON document.
+
+        Example:
+            >>> with open("template.json", "w") as f:
+            ...     f.writelines(template.iter_json_chunks(provider=MyProvider()))
+        """
+        if provider is None or not _uses_default_structure(self, provider):
+            yield _dumps(self.to_dict(provider=provider), indent)
+            return
+
+        def encoded_sections() -> Iterator[tuple[str, str | Iterator[tuple[str, str]]]]:
+            for key, value in provider.iter_template(self):
+                if key != _RESOURCES_KEY:
+                    yield _dumps(key, indent), _dumps_nested(value, indent, 1)
+                    continue
+                if not _yields_unique_resources(provider):
+                    # Collapse duplicate logical IDs like to_dict() does
+                    value = dict(_resource_items(value))
+                yield (
+                    _dumps(key, indent),
+                    (
+                        (_dumps(lid, indent), _dumps_nested(body, indent, 2))
+                        for lid, body in _resource_items(value)
+                    ),
+                )
 
-        return json.dumps(data, indent=indent, default=default_encoder)
+        yield from _iter_json_layout(encoded_sections(), indent)
 
     def to_yaml(self, provider: Provider | None = None) -> str:
         """
@@ -133,10 +133,13 @@ def apply_metaclass(cls: type[T], metaclass: type) -> type[T]:
         >>> isinstance(MyClassWithMeta, RefMeta)
         True
     """
-    # Get the class dict, excluding __dict__ and __weakref__
+    # Get the class dict, excluding __dict__ and __weakref__. Slot member
+    # descriptors are also skipped; the new class recreates them from
+    # __slots__.
+    slot_names = set(cls.__dict__.get("__slots__", ()))
     class_dict: dict[str, Any] = {}
     for key, value in cls.__dict__.items():
-        if key in ("__dict__", "__weakref__"):
+        if key in ("__dict__", "__weakref__") or key in slot_names:
             continue
         class_dict[key] = value
 
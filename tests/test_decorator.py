@@ -209,6 +209,59 @@ class TestCreateDecorator:
         attr = MyResource.Arn
         assert isinstance(attr, AttrRef)
 
+    def test_slots(self):
+        """Test slots=True produces __dict__-free instances."""
+        refs = create_decorator(slots=True)
+
+        @refs
+        class Network:
+            cidr: str = "10.0.0.0/16"
+
+        @refs
+        class Subnet:
+            network = Network
+            network_id = Network.Id
+            tags: list = ["a"]
+
+        subnet = Subnet()
+        assert not hasattr(subnet, "__dict__")
+        assert subnet.network is Network
+        assert subnet.network_id == AttrRef(Network, "Id")
+        assert subnet.tags == ["a"]
+        assert subnet.tags is not Subnet().tags
+        assert isinstance(Subnet.Arn, AttrRef)
+
+    def test_records_dependencies(self):
+        """Test no-parens references are recorded in __dsl_deps__."""
+        refs = create_decorator()
+
+        @refs
+        class Network:
+            pass
+
+        @refs
+        class Gateway:
+            pass
+
+        @refs
+        class Subnet:
+            network = Network
+            gateway_id = Gateway.Id
+            cidr: str = "10.0.1.0/24"
+
+        assert Network.__dsl_deps__ == frozenset()
+        assert Subnet.__dsl_deps__ == frozenset({Network, Gateway})
+
+    def test_interns_class_name(self):
+        """Test dynamically built class names are interned."""
+        import sys
+
+        refs = create_decorator()
+        name = "".join(["Dynamic", "Resource"])
+        cls = refs(type(name, (), {"__annotations__": {"x": int}, "x": 1}))
+
+        assert cls.__name__ is sys.intern("DynamicResource")
+
     def test_custom_post_init(self):
         """Test custom __post_init__ is preserved."""
         refs = create_decorator()
@@ -504,6 +504,26 @@ class TestUpdateAttrRefs:
         consumer_fields = {f.name: f for f in fields(Consumer)}
         assert consumer_fields["parent"].default is NewClass
 
+    def test_updates_recorded_dependencies(self):
+        """Test that __dsl_deps__ recorded at decoration is rescanned."""
+        from dataclasses import dataclass
+
+        class OldClass:
+            pass
+
+        class NewClass:
+            _refs_marker = True
+
+        @dataclass
+        class Consumer:
+            parent: type = OldClass
+
+        Consumer.__dsl_deps__ = frozenset()
+
+        _update_attr_refs({"Consumer": Consumer}, {OldClass: NewClass})
+
+        assert Consumer.__dsl_deps__ == frozenset({NewClass})
+
 
 class TestSetupResourcesAutoDecorate:
     """Tests for setup_resources with auto_decorate option."""
@@ -594,6 +614,62 @@ class DependentResource:
                 if mod_name.startswith("test_pkg"):
                     del sys.modules[mod_name]
 
+    def test_auto_decorate_same_file_forward_reference(self, tmp_path):
+        """Test a reference to a class defined later in the file is a dependency."""
+        import sys
+
+        from dataclass_dsl import (
+            ResourceRegistry,
+            Template,
+            create_decorator,
+            get_all_dependencies,
+            setup_resources,
+        )
+
+        pkg_dir = tmp_path / "forward_pkg"
+        pkg_dir.mkdir()
+        (pkg_dir / "__init__.py").write_text("")
+        (pkg_dir / "resources.py").write_text(
+            """
+from . import *
+
+class Bucket:
+    resource: str
+    policy = Policy
+
+class Policy:
+    resource: str
+"""
+        )
+
+        registry = ResourceRegistry()
+        package_globals: dict = {}
+
+        sys.path.insert(0, str(tmp_path))
+        try:
+            setup_resources(
+                str(pkg_dir / "__init__.py"),
+                "forward_pkg",
+                package_globals,
+                auto_decorate=True,
+                decorator=create_decorator(registry=registry),
+                generate_stubs=False,
+            )
+
+            bucket = package_globals["Bucket"]
+            policy = package_globals["Policy"]
+            assert get_all_dependencies(bucket) == {policy}
+
+            template = Template.from_registry(registry)
+            order = [type(r).__name__ for r in template.get_dependency_order()]
+            assert order == ["Policy", "Bucket"]
+
+        finally:
+            sys.path.remove(str(tmp_path))
+            for mod_name in list(sys.modules.keys()):
+                if mod_name.startswith("forward_pkg"):
+                    del sys.modules[mod_name]
+
     def test_resource_predicate_inheritance_pattern(self, tmp_path):
         """Test resource_predicate for inheritance-based resource detection."""
         from dataclass_dsl import create_decorator, setup_resources
@@ -668,3 +744,128 @@ class NotAResource:
             for mod_name in list(sys.modules.keys()):
                 if mod_name.startswith("predicate_pkg"):
                     del sys.modules[mod_name]
+
+
+class TestSetupResourcesLazy:
+    """Tests for setup_resources with lazy=True."""
+
+    @pytest.fixture
+    def lazy_pkg(self, tmp_path):
+        """Create a package that loads its modules lazily."""
+        import sys
+
+        pkg_dir = tmp_path / "lazy_pkg"
+        pkg_dir.mkdir()
+        (pkg_dir / "__init__.py").write_text(
+            """
+from dataclass_dsl import ResourceRegistry, create_decorator, setup_resources
+
+registry = ResourceRegistry()
+refs = create_decorator(registry=registry)
+
+setup_resources(
+    __file__,
+    __name__,
+    globals(),
+    auto_decorate=True,
+    decorator=refs,
+    generate_stubs=False,
+    lazy=True,
+    registry=registry,
+)
+"""
+        )
+        (pkg_dir / "network.py").write_text(
+            """
+from . import *
+
+class Network:
+    resource: str
+    name = "net"
+"""
+        )
+        (pkg_dir / "server.py").write_text(
+            """
+from . import *
+
+class Server:
+    resource: str
+    network = Network
+"""
+        )
+        (pkg_dir / "unrelated.py").write_text(
+            """
+from . import *
+
+class Unrelated:
+    resource: str
+"""
+        )
+
+        sys.path.insert(0, str(tmp_path))
+        try:
+            import lazy_pkg
+
+            yield lazy_pkg
+        finally:
+            sys.path.remove(str(tmp_path))
+            for mod_name in list(sys.modules.keys()):
+                if mod_name.startswith("lazy_pkg"):
+                    del sys.modules[mod_name]
+
+    def test_modules_not_imported_at_setup(self, lazy_pkg):
+        """Test that no resource module is imported by setup_resources."""
+        import sys
+
+        assert sorted(lazy_pkg.__all__) == ["Network", "Server", "Unrelated"]
+        assert not [m for m in sys.modules if m.startswith("lazy_pkg.")]
+        assert "Server" in lazy_pkg.registry._pending
+
+    def test_attribute_access_loads_dependencies(self, lazy_pkg):
+        """Test that accessing a class loads its module and its dependencies."""
+        import dataclasses
+        import sys
+
+        server = lazy_pkg.Server
+        assert hasattr(server, "_refs_marker")
+        assert "lazy_pkg.network" in sys.modules
+        assert "lazy_pkg.unrelated" not in sys.modules
+
+        fields = {f.name: f for f in dataclasses.fields(server)}
+        assert fields["network"].default is lazy_pkg.Network
+        assert sorted(lazy_pkg.__all__) == ["Network", "Server", "Unrelated"]
+
+    def test_registry_materializes_placeholders(self, lazy_pkg):
+        """Test that registry queries import pending classes on demand."""
+        import sys
+
+        network = lazy_pkg.registry.get_by_name("Network")
+        assert network is lazy_pkg.Network
+        assert "lazy_pkg.server" not in sys.modules
+
+        names = [cls.__name__ for cls in lazy_pkg.registry.get_creation_order()]
+        assert sorted(names) == ["Network", "Server", "Unrelated"]
+        assert names.index("Network") < names.index("Server")
+        assert "lazy_pkg.unrelated" in sys.modules
+
+    def test_reimport_registers_again(self, lazy_pkg):
+        """Test that a re-imported package materializes into its new registry."""
+        import importlib
+        import sys
+
+        assert lazy_pkg.registry.get_by_name("Network") is not None
+        for mod_name in list(sys.modules.keys()):
+            if mod_name.startswith("lazy_pkg"):
+                del sys.modules[mod_name]
+
+        reimported = importlib.import_module("lazy_pkg")
+        assert reimported.registry is not lazy_pkg.registry
+        network = reimported.registry.get_by_name("Network")
+        assert network is reimported.Network
+        assert network is not lazy_pkg.Network
+        assert len(reimported.registry.get_all()) == 3
+
+    def test_unknown_attribute_raises(self, lazy_pkg):
+        """Test that unknown names still raise AttributeError."""
+        with pytest.raises(AttributeError, match="Missing"):
+            _ = lazy_pkg.Missing
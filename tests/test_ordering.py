@@ -181,6 +181,53 @@ class TestTopologicalSort:
         assert result.index(SubnetA) < result.index(Instance)
         assert result.index(SubnetB) < result.index(Instance)
 
+    def test_stable_order(self, refs):
+        """Test independent classes keep their input order."""
+
+        @refs
+        class A:
+            pass
+
+        @refs
+        class B:
+            pass
+
+        @refs
+        class C:
+            a: Annotated[A, Ref()] = None
+
+        assert topological_sort([C, B, A]) == [B, A, C]
+        assert topological_sort([B, A, C]) == [B, A, C]
+
+    def test_ignores_unlisted_dependencies(self, refs):
+        """Test dependencies outside the input list do not block sorting."""
+
+        @refs
+        class External:
+            pass
+
+        @refs
+        class Internal:
+            external: Annotated[External, Ref()] = None
+
+        assert topological_sort([Internal]) == [Internal]
+
+    def test_cycle_raises(self, refs):
+        """Test circular dependencies raise ValueError."""
+
+        @refs
+        class A:
+            pass
+
+        @refs
+        class B:
+            a: Annotated[A, Ref()] = None
+
+        A.__annotations__["b"] = Annotated[B, Ref()]
+
+        with pytest.raises(ValueError, match="Circular dependency"):
+            topological_sort([A, B])
+
 
 class TestCreationDeletionOrder:
     """Tests for get_creation_order and get_deletion_order."""
@@ -227,6 +274,67 @@ class TestCreationDeletionOrder:
         assert order[1] is Subnet
         assert order[2] is Network
 
+    def test_creation_order_repeated_calls(self, refs):
+        """Test repeated calls return equal, independent lists."""
+
+        @refs
+        class Network:
+            pass
+
+        @refs
+        class Subnet:
+            network: Annotated[Network, Ref()] = None
+
+        first = get_creation_order([Subnet, Network])
+        first.append(None)
+        second = get_creation_order([Network, Subnet])
+
+        assert second == [Network, Subnet]
+
+    def test_cache_cleared_on_decoration(self, refs):
+        """Test decorating a new class invalidates memoized dependencies."""
+
+        @refs
+        class A:
+            pass
+
+        assert get_all_dependencies(A) == set()
+
+        @refs
+        class B:
+            pass
+
+        # Rewire A after its dependencies were memoized
+        A.__annotations__["b"] = Annotated[B, Ref()]
+
+        @refs
+        class C:
+            pass
+
+        assert get_all_dependencies(A) == {B}
+
+    def test_dependency_cache_does_not_keep_classes_alive(self, refs):
+        """Test memoized dependencies can still be garbage collected."""
+        import gc
+        import weakref
+
+        @refs
+        class Network:
+            pass
+
+        @refs
+        class Subnet:
+            network = Network
+
+        assert get_all_dependencies(Subnet) == {Network}
+        subnet_ref = weakref.ref(Subnet)
+        network_ref = weakref.ref(Network)
+        del Subnet, Network
+        gc.collect()
+
+        assert subnet_ref() is None
+        assert network_ref() is None
+
 
 class TestDetectCycles:
     """Tests for detect_cycles function."""
@@ -1,5 +1,7 @@
 """Tests for Provider abstract base class."""
 
+from typing import Any
+
 import pytest
 
 from dataclass_dsl import Provider, create_decorator
@@ -175,3 +177,188 @@ class TestProvider:
         provider = SimpleProvider()
         assert "SimpleProvider" in repr(provider)
         assert "simple" in repr(provider)
+
+    def test_get_properties(self):
+        """Test get_properties returns plain data fields only."""
+        refs = create_decorator()
+
+        @refs
+        class Network:
+            cidr: str = "10.0.0.0/16"
+
+        @refs
+        class Subnet:
+            network = Network
+            network_id = Network.Id
+            cidr: str = "10.0.1.0/24"
+            tags: list = ["a"]
+
+        class SimpleProvider(Provider):
+            name = "simple"
+
+            def serialize_ref(self, source, target):
+                return None
+
+            def serialize_attr(self, source, target, attr_name):
+                return None
+
+            def serialize_resource(self, resource):
+                return {}
+
+        provider = SimpleProvider()
+        instance = Subnet()
+
+        assert provider.get_type_name(instance) == "Subnet"
+        assert provider.get_property_names(instance) == ("cidr", "tags")
+        assert provider.get_properties(instance) == {
+            "cidr": "10.0.1.0/24",
+            "tags": ["a"],
+        }
+
+    def test_get_properties_skips_missing(self):
+        """Test fields absent from an instance are omitted."""
+        refs = create_decorator()
+
+        @refs
+        class MyResource:
+            name: str = "test"
+            tags: list = ["a"]
+
+        class SimpleProvider(Provider):
+            name = "simple"
+
+            def serialize_ref(self, source, target):
+                return None
+
+            def serialize_attr(self, source, target, attr_name):
+                return None
+
+            def serialize_resource(self, resource):
+                return {}
+
+        provider = SimpleProvider()
+        assert provider.get_properties(MyResource()) == {"name": "test", "tags": ["a"]}
+
+        partial = MyResource()
+        del partial.tags
+        assert provider.get_properties(partial) == {"name": "test"}
+
+    def test_get_properties_slotted(self):
+        """Test get_properties works for instances without __dict__."""
+        refs = create_decorator(slots=True)
+
+        @refs
+        class Network:
+            cidr: str = "10.0.0.0/16"
+
+        @refs
+        class Subnet:
+            network = Network
+            cidr: str = "10.0.1.0/24"
+
+        class SimpleProvider(Provider):
+            name = "simple"
+
+            def serialize_ref(self, source, target):
+                return None
+
+            def serialize_attr(self, source, target, attr_name):
+                return None
+
+            def serialize_resource(self, resource):
+                return {}
+
+        assert SimpleProvider().get_properties(Subnet()) == {"cidr": "10.0.1.0/24"}
+
+    def test_get_property_names_cached_per_class(self):
+        """Test field classification is cached and shared across providers."""
+        refs = create_decorator()
+
+        @refs
+        class MyResource:
+            name: str = "test"
+
+        class SimpleProvider(Provider):
+            name = "simple"
+
+            def serialize_ref(self, source, target):
+                return None
+
+            def serialize_attr(self, source, target, attr_name):
+                return None
+
+            def serialize_resource(self, resource):
+                return {}
+
+        first = SimpleProvider().get_property_names(MyResource())
+        second = SimpleProvider().get_property_names(MyResource(name="other"))
+
+        assert first is second
+        assert MyResource in Provider._field_cache
+
+    def test_get_properties_classifies_each_instance(self):
+        """Test a field holding a reference on one instance is kept on another."""
+        refs = create_decorator()
+
+        @refs
+        class Network:
+            cidr: str = "10.0.0.0/16"
+
+        @refs
+        class Subnet:
+            network: Any = None
+            cidr: str = "10.0.1.0/24"
+
+        class SimpleProvider(Provider):
+            name = "simple"
+
+            def serialize_ref(self, source, target):
+                return None
+
+            def serialize_attr(self, source, target, attr_name):
+                return None
+
+            def serialize_resource(self, resource):
+                return {}
+
+        provider = SimpleProvider()
+        with_ref = Subnet(network=Network.Id)
+        with_value = Subnet(network="vpc-123")
+
+        assert provider.get_properties(with_ref) == {"cidr": "10.0.1.0/24"}
+        assert provider.get_property_names(with_ref) == ("cidr",)
+        assert provider.get_properties(with_value) == {
+            "network": "vpc-123",
+            "cidr": "10.0.1.0/24",
+        }
+        assert provider.get_property_names(with_value) == ("network", "cidr")
+
+    def test_field_cache_does_not_keep_classes_alive(self):
+        """Test cached classes can still be garbage collected."""
+        import gc
+        import weakref
+
+        refs = create_decorator()
+
+        @refs
+        class Temporary:
+            name: str = "test"
+
+        class SimpleProvider(Provider):
+            name = "simple"
+
+            def serialize_ref(self, source, target):
+                return None
+
+            def serialize_attr(self, source, target, attr_name):
+                return None
+
+            def serialize_resource(self, resource):
+                return {}
+
+        SimpleProvider().get_properties(Temporary())
+        ref = weakref.ref(Temporary)
+        del Temporary
+        gc.collect()
+
+        assert ref() is None
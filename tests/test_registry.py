@@ -163,6 +163,36 @@ class TestResourceRegistry:
         not_found = registry.get_by_name("NonExistent")
         assert not_found is None
 
+    def test_register_lazy_placeholder(self):
+        """Test that placeholders are imported before answering queries."""
+        registry = ResourceRegistry()
+
+        class A:
+            pass
+
+        registry.register(A)
+        registry.register_lazy("OrderedDict", "collections:OrderedDict")
+        registry.register_lazy("Counter", "collections:Counter")
+
+        # Importing the placeholders registers nothing here, so queries
+        # give the same answer before and after materialization
+        assert "OrderedDict" not in registry
+        assert len(registry) == 1
+        assert registry.get_by_name("Counter") is None
+        assert registry.get_all() == [A]
+
+    def test_register_replaces_lazy_placeholder(self):
+        """Test that registering the real class replaces its placeholder."""
+        registry = ResourceRegistry()
+        registry.register_lazy("A", "missing.module:A")
+
+        class A:
+            pass
+
+        registry.register(A)
+        assert registry.get_by_name("A") is A
+        assert len(registry) == 1
+
     def test_thread_safety(self):
         """Test registry is thread-safe."""
         registry = ResourceRegistry()
@@ -201,6 +231,25 @@ class TestResourceRegistry:
 
         assert len(registry) == 1
 
+    def test_reregister_name_replaces_class(self):
+        """Test registering a new class under an existing name replaces it."""
+        registry = ResourceRegistry()
+
+        class MyResource:
+            pass
+
+        old = MyResource
+
+        class MyResource:  # noqa: F811
+            pass
+
+        registry.register(old)
+        registry.register(MyResource)
+
+        assert MyResource in registry
+        assert old not in registry
+        assert registry.get_all() == [MyResource]
+
     def test_repr(self):
         """Test registry string representation."""
         registry = ResourceRegistry()
@@ -243,3 +292,40 @@ class TestRegistryWithDecorator:
             name: str = "test"
 
         assert MyResource not in registry
+
+    def test_creation_order(self):
+        """Test registry returns classes with dependencies first."""
+        registry = ResourceRegistry()
+        refs = create_decorator(registry=registry)
+
+        @refs
+        class Network:
+            pass
+
+        @refs
+        class Subnet:
+            network = Network
+
+        @refs
+        class Instance:
+            subnet = Subnet
+
+        assert registry.get_creation_order() == [Network, Subnet, Instance]
+        assert registry.get_deletion_order() == [Instance, Subnet, Network]
+
+    def test_creation_order_updated_on_register(self):
+        """Test cached creation order is refreshed by new registrations."""
+        registry = ResourceRegistry()
+        refs = create_decorator(registry=registry)
+
+        @refs
+        class Network:
+            pass
+
+        assert registry.get_creation_order() == [Network]
+
+        @refs
+        class Subnet:
+            network = Network
+
+        assert registry.get_creation_order() == [Network, Subnet]
@@ -143,6 +143,48 @@ class TestTemplate:
         assert names.index("Network") < names.index("Subnet")
         assert names.index("Subnet") < names.index("Instance")
 
+    def test_get_dependency_order_tracks_resources(self, refs):
+        """Test cached dependency order is refreshed when resources change."""
+
+        @refs
+        class Network:
+            cidr: str = "10.0.0.0/16"
+
+        @refs
+        class Subnet:
+            network: Annotated[Network, Ref()] = None
+
+        template = Template()
+        template.add_resource(Network())
+        assert [type(r) for r in template.get_dependency_order()] == [Network]
+
+        template.resources.insert(0, Subnet())
+        ordered = template.get_dependency_order()
+        assert [type(r) for r in ordered] == [Network, Subnet]
+        assert template.get_dependency_order() == ordered
+
+    def test_from_registry_keeps_registry_order(self, registry, refs, monkeypatch):
+        """Test from_registry templates reuse the registry order without sorting."""
+        from dataclass_dsl import _template
+
+        @refs
+        class Network:
+            cidr: str = "10.0.0.0/16"
+
+        @refs
+        class Subnet:
+            network: Annotated[Network, Ref()] = None
+
+        template = Template.from_registry(registry)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("resources were sorted again")
+
+        monkeypatch.setattr(_template, "get_creation_order", fail)
+        ordered = template.get_dependency_order()
+        assert [type(r) for r in ordered] == [Network, Subnet]
+        assert ordered == template.resources
+
     def test_to_dict_generic(self, refs):
         """Test generic dict serialization."""
 
@@ -209,6 +251,209 @@ class TestTemplate:
         assert parsed["Description"] == "Test"
         assert "MyResource" in parsed["Resources"]
 
+    def test_to_json_matches_stdlib(self, refs):
+        """Test default to_json text is the stdlib encoder's, byte for byte."""
+        import enum
+
+        from dataclass_dsl import _template
+
+        class Color(enum.Enum):
+            RED = "red"
+
+        @refs
+        class MyResource:
+            name: str = "tëst ✓"
+            tags: list = ["a", "b"]
+            ratio: float = float("nan")
+            size: float = 1e16
+            color: Color = Color.RED
+
+        template = Template(description="Tést", parameters={"Env": "prod"})
+        template.add_resource(MyResource())
+        provider = SimpleProvider()
+
+        expected = json.dumps(
+            template.to_dict(provider=provider),
+            indent=2,
+            default=_template._default_encoder,
+        )
+        assert template.to_json(provider=provider) == expected
+
+    def test_to_json_use_orjson(self, refs):
+        """Test opt-in orjson encoding produces equivalent JSON."""
+        pytest.importorskip("orjson")
+
+        @refs
+        class MyResource:
+            name: str = "test"
+            tags: list = ["a", "b"]
+
+        template = Template(description="Test", parameters={"Env": "prod"})
+        template.add_resource(MyResource())
+        provider = SimpleProvider()
+
+        fast = template.to_json(provider=provider, use_orjson=True)
+        assert fast == template.to_json(provider=provider)
+        assert json.loads(
+            template.to_json(provider=provider, indent=4, use_orjson=True)
+        ) == (json.loads(fast))
+
+    @pytest.mark.parametrize("indent", [None, 0, 2, 4])
+    def test_iter_json_chunks_matches_dict(self, refs, indent):
+        """Test streamed chunks join to the same text as encoding to_dict()."""
+
+        @refs
+        class Network:
+            cidr: str = "10.0.0.0/16"
+
+        @refs
+        class Subnet:
+            network: Annotated[Network, Ref()] = None
+            tags: dict = {"Name": "subnet"}
+
+        template = Template(description="Test", outputs={"Id": {"Value": "x"}})
+        template.add_resource(Subnet())
+        template.add_resource(Network())
+
+        provider = SimpleProvider()
+        chunks = list(template.iter_json_chunks(provider=provider, indent=indent))
+        expected = json.dumps(template.to_dict(provider=provider), indent=indent)
+
+        assert len(chunks) > 1
+        assert "".join(chunks) == expected
+
+    def test_to_json_uses_overridden_to_dict(self, refs):
+        """Test subclasses overriding to_dict() keep their JSON output."""
+
+        class VersionedTemplate(Template):
+            def to_dict(self, provider=None):
+                result = {"FormatVersion": "1"}
+                result.update(super().to_dict(provider=provider))
+                return result
+
+        @refs
+        class Network:
+            cidr: str = "10.0.0.0/16"
+
+        template = VersionedTemplate(description="Test")
+        template.add_resource(Network())
+        provider = SimpleProvider()
+
+        expected = json.dumps(template.to_dict(provider=provider), indent=2)
+        assert template.to_json(provider=provider) == expected
+        assert "".join(template.iter_json_chunks(provider=provider)) == expected
+
+    @pytest.mark.parametrize("indent", [None, 2, 4])
+    def test_to_json_matches_chunks(self, refs, indent):
+        """Test skeleton-based to_json matches the streamed output."""
+
+        @refs
+        class Network:
+            cidr: str = "10.0.0.0/16"
+
+        template = Template(description="100% test", parameters={"Env": "prod"})
+        template.add_resource(Network())
+
+        provider = SimpleProvider()
+        expected = "".join(template.iter_json_chunks(provider=provider, indent=indent))
+
+        assert template.to_json(provider=provider, indent=indent) == expected
+
+    def test_to_json_with_overridden_iter_resources(self, refs):
+        """Test to_json follows providers that filter or rename resources."""
+
+        class FilteringProvider(SimpleProvider):
+            def iter_resources(self, template):
+                for logical_id, body in super().iter_resources(template):
+                    if logical_id != "Subnet":
+                        yield f"{logical_id}Renamed", body
+
+        @refs
+        class Network:
+            cidr: str = "10.0.0.0/16"
+
+        @refs
+        class Subnet:
+            cidr: str = "10.0.1.0/24"
+
+        template = Template(description="Test")
+        template.add_resource(Network())
+        template.add_resource(Subnet())
+        provider = FilteringProvider()
+
+        result = json.loads(template.to_json(provider=provider))
+        assert result == template.to_dict(provider=provider)
+        assert list(result["Resources"]) == ["NetworkRenamed"]
+        assert template.compile(provider).count("%s") == 2
+
+    @pytest.mark.parametrize("override", ["get_logical_id", "iter_resources"])
+    def test_duplicate_logical_ids_collapse_like_to_dict(self, refs, override):
+        """Test resources sharing a logical ID are written once, last one wins."""
+
+        class SharedIdProvider(SimpleProvider):
+            if override == "get_logical_id":
+
+                def get_logical_id(self, wrapper_cls):
+                    return "Shared"
+
+            else:
+
+                def iter_resources(self, template):
+                    for _, body in super().iter_resources(template):
+                        yield "Shared", body
+
+        @refs
+        class Network:
+            cidr: str = "10.0.0.0/16"
+
+        @refs
+        class Subnet:
+            cidr: str = "10.0.1.0/24"
+
+        template = Template(description="Test")
+        template.add_resource(Network())
+        template.add_resource(Subnet())
+        provider = SharedIdProvider()
+
+        expected = json.dumps(template.to_dict(provider=provider), indent=2)
+        assert template.to_json(provider=provider) == expected
+        assert "".join(template.iter_json_chunks(provider=provider)) == expected
+        last = template.get_dependency_order()[-1]
+        assert json.loads(expected)["Resources"] == {
+            "Shared": provider.serialize_resource(last)
+        }
+
+    def test_compile_cached_until_shape_changes(self, refs):
+        """Test the skeleton is reused until resources change."""
+
+        @refs
+        class Network:
+            cidr: str = "10.0.0.0/16"
+
+        @refs
+        class Subnet:
+            cidr: str = "10.0.1.0/24"
+
+        template = Template(description="Test")
+        template.add_resource(Network())
+        provider = SimpleProvider()
+
+        skeleton = template.compile(provider)
+        assert template.compile(provider) is skeleton
+        assert skeleton.count("%s") == 2
+
+        template.add_resource(Subnet())
+        assert template.compile(provider).count("%s") == 3
+        assert json.loads(template.to_json(provider=provider))["Resources"].keys() == {
+            "Network",
+            "Subnet",
+        }
+
+    def test_iter_json_chunks_empty(self):
+        """Test streaming an empty template."""
+        template = Template()
+        assert "".join(template.iter_json_chunks(provider=SimpleProvider())) == "{}"
+
     def test_validate_no_duplicates(self, refs):
         """Test validation passes with unique resources."""
 